@@ -21,18 +21,20 @@ jwt = JWTManager()
 swagger = Swagger()
 
 
-def create_app(config_class=Config):
+def create_app(config_class=Config, **config_overrides):
     """
     Create and configure the Flask application.
 
     Args:
         config_class: Configuration class to use for the app
+        **config_overrides: Config values applied on top of config_class
 
     Returns:
         Flask: Configured Flask application instance
     """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.config.from_mapping(config_overrides)
 
     # Initialize extensions
     db.init_app(app)
@@ -408,39 +410,15 @@ def create_app(config_class=Config):
     # Register blueprints
     from app.routes.auth import auth_bp
     from app.routes.consumption import consumption_bp
+    from app.routes.health import health_bp
 
     app.register_blueprint(auth_bp, url_prefix="/api/auth")
     app.register_blueprint(consumption_bp, url_prefix="/api/consumption")
+    app.register_blueprint(health_bp)
 
-    # Add health check endpoint
-    @app.route("/health")
-    @app.route("/api/health")
-    def health_check():
-        """
-        Health check endpoint for monitoring.
-        ---
-        tags:
-          - Health
-        responses:
-          200:
-            description: Service is healthy
-            schema:
-              type: object
-              properties:
-                status:
-                  type: string
-                  example: healthy
-                service:
-                  type: string
-                  example: consumer-testapp-backend
-                version:
-                  type: string
-                  example: 1.0.0
-        """
-        return {
-            "status": "healthy",
-            "service": "consumer-testapp-backend",
-            "version": "1.0.0",
-        }
+    # Warm up request validation instead of paying for it on the first request
+    from app.schemas import warm_up_request_validators
+
+    warm_up_request_validators()
 
     return app
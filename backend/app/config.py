@@ -26,6 +26,9 @@ class Config:
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=30)
 
+    # Password hashing work factor (bcrypt log2 rounds)
+    BCRYPT_LOG_ROUNDS = 12
+
     # CORS configuration
     CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "*").split(",")
 
@@ -52,6 +55,8 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     WTF_CSRF_ENABLED = False
+    # Minimum bcrypt cost: keeps password hashing cheap in tests only
+    BCRYPT_LOG_ROUNDS = 4
 
 
 class ProductionConfig(Config):
@@ -8,10 +8,12 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
 import bcrypt
+from flask import current_app, has_app_context
 from sqlalchemy import Boolean, DateTime, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app import db
+from app.config import Config
 
 if TYPE_CHECKING:
     from app.models.consumption import Consumption
@@ -78,8 +80,13 @@ class User(db.Model):
         Args:
             password: Plain text password to hash and store
         """
-        # Generate a salt and hash the password
-        salt = bcrypt.gensalt()
+        # Generate a salt with the configured work factor and hash the password
+        rounds = (
+            current_app.config.get("BCRYPT_LOG_ROUNDS", Config.BCRYPT_LOG_ROUNDS)
+            if has_app_context()
+            else Config.BCRYPT_LOG_ROUNDS
+        )
+        salt = bcrypt.gensalt(rounds=rounds)
         self.password_hash = bcrypt.hashpw(password.encode("utf-8"), salt).decode(
             "utf-8"
         )
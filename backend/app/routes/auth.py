@@ -23,6 +23,15 @@ from app.utils.jwt_utils import create_tokens
 
 auth_bp = Blueprint("auth", __name__)
 
+# Readable messages for constraint errors raised by pydantic-core, keyed by
+# (field, error type), so clients never see the raw regex
+REGISTRATION_ERROR_MESSAGES = {
+    ("username", "string_pattern_mismatch"): (
+        "Value error, Username can only contain letters, numbers, "
+        "underscores, and hyphens"
+    ),
+}
+
 
 @auth_bp.route("/health")
 def auth_health():
@@ -180,7 +189,10 @@ def register():
                 field = (
                     error.get("loc", ["unknown"])[-1] if error.get("loc") else "unknown"
                 )
-                message = error.get("msg", "Validation error")
+                message = REGISTRATION_ERROR_MESSAGES.get(
+                    (str(field), error.get("type")),
+                    error.get("msg", "Validation error"),
+                )
                 errors[str(field)] = message
 
             return (
@@ -225,8 +237,8 @@ def register():
         db.session.add(new_user)
         db.session.commit()
 
-        # Prepare response
-        response_data = UserRegistrationResponse(
+        # Prepare response (server-side data, no validation needed)
+        response_data = UserRegistrationResponse.model_construct(
             id=new_user.id,
             username=new_user.username,
             email=new_user.email,
@@ -459,8 +471,8 @@ def login():
         # Create JWT tokens
         tokens = create_tokens(user)
 
-        # Prepare user data for response
-        user_data = UserRegistrationResponse(
+        # Prepare user data for response (server-side data, no validation needed)
+        user_data = UserRegistrationResponse.model_construct(
             id=user.id,
             username=user.username,
             email=user.email,
@@ -469,7 +481,7 @@ def login():
         )
 
         # Prepare response
-        response_data = UserLoginResponse(
+        response_data = UserLoginResponse.model_construct(
             access_token=tokens["access_token"],
             refresh_token=tokens["refresh_token"],
             user=user_data,
@@ -0,0 +1,42 @@
+"""
+Service health check routes.
+
+This module contains the top-level health check endpoint used for
+monitoring. It has no dependencies on the database or authentication, so
+the blueprint can be registered on its own.
+"""
+
+from flask import Blueprint
+
+health_bp = Blueprint("health", __name__)
+
+
+@health_bp.route("/health")
+@health_bp.route("/api/health")
+def health_check():
+    """
+    Health check endpoint for monitoring.
+    ---
+    tags:
+      - Health
+    responses:
+      200:
+        description: Service is healthy
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: healthy
+            service:
+              type: string
+              example: consumer-testapp-backend
+            version:
+              type: string
+              example: 1.0.0
+    """
+    return {
+        "status": "healthy",
+        "service": "consumer-testapp-backend",
+        "version": "1.0.0",
+    }
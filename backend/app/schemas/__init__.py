@@ -6,20 +6,43 @@ operations like user registration and login, as well as consumption
 data management.
 """
 
-import re
+import string
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+
+class ResponseModel(BaseModel):
+    """
+    Base schema for server-built responses: immutable and strict on fields.
+
+    Responses built from trusted server-side data (database rows, generated
+    tokens) can be created with ``Model.model_construct(...)`` to skip
+    validation. Never use ``model_construct`` on user-supplied data.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_default=False)
 
 
 class UserRegistrationRequest(BaseModel):
     """Schema for user registration request."""
 
-    username: str = Field(
+    username: Annotated[
+        str,
+        StringConstraints(
+            min_length=3, max_length=80, pattern=r"^[a-zA-Z0-9_-]+$", to_lower=True
+        ),
+    ] = Field(
         ...,
-        min_length=3,
-        max_length=80,
         description="Unique username for the user",
         examples=["johndoe", "user123"],
     )
@@ -41,28 +64,25 @@ class UserRegistrationRequest(BaseModel):
         examples=["SecurePass123!"],
     )
 
-    @field_validator("username")
-    @classmethod
-    def validate_username(cls, v: str) -> str:
-        """Validate username format."""
-        if not re.match(r"^[a-zA-Z0-9_-]+$", v):
-            raise ValueError(
-                "Username can only contain letters, numbers, underscores, and hyphens"
-            )
-        return v.lower()
-
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-
-        # Check for at least one letter and one number
-        if not re.search(r"[a-zA-Z]", v):
+        # Length is already enforced by the field's min_length constraint.
+        # Check for at least one letter and one number in a single pass.
+        has_letter = has_number = False
+        for char in v:
+            if char in string.ascii_letters:
+                has_letter = True
+            elif char.isdecimal():
+                has_number = True
+            if has_letter and has_number:
+                break
+
+        if not has_letter:
             raise ValueError("Password must contain at least one letter")
 
-        if not re.search(r"\d", v):
+        if not has_number:
             raise ValueError("Password must contain at least one number")
 
         return v
@@ -75,7 +95,7 @@ class UserRegistrationRequest(BaseModel):
         return self
 
 
-class UserRegistrationResponse(BaseModel):
+class UserRegistrationResponse(ResponseModel):
     """Schema for user registration response."""
 
     id: int = Field(..., description="Unique user ID")
@@ -100,7 +120,7 @@ class UserLoginRequest(BaseModel):
     )
 
 
-class UserLoginResponse(BaseModel):
+class UserLoginResponse(ResponseModel):
     """Schema for user login response."""
 
     access_token: str = Field(..., description="JWT access token")
@@ -109,7 +129,7 @@ class UserLoginResponse(BaseModel):
     message: str = Field(default="Login successful", description="Success message")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Schema for error responses."""
 
     error: str = Field(..., description="Error type or code")
@@ -119,7 +139,7 @@ class ErrorResponse(BaseModel):
     )
 
 
-class ValidationErrorResponse(BaseModel):
+class ValidationErrorResponse(ResponseModel):
     """Schema for validation error responses."""
 
     error: str = Field(default="validation_error", description="Error type")
@@ -129,7 +149,7 @@ class ValidationErrorResponse(BaseModel):
     details: dict = Field(..., description="Field-specific validation errors")
 
 
-class SuccessResponse(BaseModel):
+class SuccessResponse(ResponseModel):
     """Schema for generic success responses."""
 
     success: bool = Field(default=True, description="Success status")
@@ -184,7 +204,7 @@ class ConsumptionCreateRequest(BaseModel):
         return v
 
 
-class ConsumptionResponse(BaseModel):
+class ConsumptionResponse(ResponseModel):
     """Schema for consumption record response."""
 
     id: int = Field(..., description="Unique consumption record ID")
@@ -197,7 +217,7 @@ class ConsumptionResponse(BaseModel):
     updated_at: str = Field(..., description="ISO timestamp of last update")
 
 
-class ConsumptionCreateResponse(BaseModel):
+class ConsumptionCreateResponse(ResponseModel):
     """Schema for consumption creation response."""
 
     consumption: ConsumptionResponse = Field(
@@ -208,7 +228,7 @@ class ConsumptionCreateResponse(BaseModel):
     )
 
 
-class PaginationMetadata(BaseModel):
+class PaginationMetadata(ResponseModel):
     """Schema for pagination metadata."""
 
     page: int = Field(..., description="Current page number (1-based)")
@@ -219,7 +239,7 @@ class PaginationMetadata(BaseModel):
     has_next: bool = Field(..., description="Whether there is a next page")
 
 
-class ConsumptionListResponse(BaseModel):
+class ConsumptionListResponse(ResponseModel):
     """Schema for consumption list response."""
 
     consumptions: list[ConsumptionResponse] = Field(
@@ -232,7 +252,7 @@ class ConsumptionListResponse(BaseModel):
     )
 
 
-class MonthlyConsumption(BaseModel):
+class MonthlyConsumption(ResponseModel):
     """Schema for monthly consumption data."""
 
     month: str = Field(..., description="Month in YYYY-MM format", examples=["2023-10"])
@@ -244,7 +264,7 @@ class MonthlyConsumption(BaseModel):
     gas: float = Field(default=0.0, description="Gas consumption for the month")
 
 
-class ConsumptionAnalytics(BaseModel):
+class ConsumptionAnalytics(ResponseModel):
     """Schema for consumption analytics response."""
 
     total_consumption: float = Field(
@@ -264,7 +284,7 @@ class ConsumptionAnalytics(BaseModel):
     )
 
 
-class AnalyticsResponse(BaseModel):
+class AnalyticsResponse(ResponseModel):
     """Schema for analytics endpoint response."""
 
     analytics: ConsumptionAnalytics = Field(
@@ -273,3 +293,22 @@ class AnalyticsResponse(BaseModel):
     message: str = Field(
         default="Analytics data retrieved successfully", description="Success message"
     )
+
+
+def warm_up_request_validators() -> None:
+    """
+    Run the request validators' one-off setup ahead of the first request.
+
+    The schemas' core validators are built when their classes are defined, but
+    the email validator still does some setup on first use. Validating a
+    sample registration at application start-up keeps that cost out of the
+    first ``/register`` and ``/login`` requests.
+    """
+    UserRegistrationRequest.model_validate(
+        {
+            "username": "warm_up",
+            "email": "warm-up@example.com",
+            "password": "warmup123",
+            "confirm_password": "warmup123",
+        }
+    )
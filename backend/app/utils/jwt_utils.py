@@ -13,9 +13,10 @@ from flask_jwt_extended import (
     create_access_token,
     create_refresh_token,
     get_jwt_identity,
-    jwt_required,
     verify_jwt_in_request,
 )
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
 
 from app.models.user import User
 
@@ -55,7 +56,21 @@ def get_current_user() -> Optional[User]:
     try:
         # Verify JWT is present and valid
         verify_jwt_in_request()
+    except (JWTExtendedException, PyJWTError):
+        # Missing, malformed, expired or otherwise invalid token
+        return None
+
+    return _get_current_user_verified()
+
+
+def _get_current_user_verified() -> Optional[User]:
+    """
+    Get the current user from a JWT that has already been verified.
 
+    Returns:
+        User instance if the token identity maps to an existing user, None otherwise
+    """
+    try:
         # Get user ID from token (convert from string to int)
         user_id_str = get_jwt_identity()
 
@@ -70,8 +85,6 @@ def get_current_user() -> Optional[User]:
     except (ValueError, TypeError):
         # Handle conversion errors
         return None
-    except Exception:
-        return None
 
 
 def token_required(f):
@@ -86,10 +99,11 @@ def token_required(f):
     """
 
     @wraps(f)
-    @jwt_required()
     def decorated_function(*args, **kwargs):
-        # Get current user
-        current_user = get_current_user()
+        # Verify the token inline; JWT errors propagate to the JWTManager
+        # error handlers exactly as they would under jwt_required()
+        verify_jwt_in_request()
+        current_user = _get_current_user_verified()
 
         if not current_user:
             return {
@@ -8,8 +8,10 @@ import os
 
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file. Production deployments inject
+# their environment directly, so skip reading .env there.
+if os.environ.get("FLASK_ENV") != "production":
+    load_dotenv()
 
 from app import create_app  # noqa: E402
 from app.config import DevelopmentConfig, ProductionConfig  # noqa: E402
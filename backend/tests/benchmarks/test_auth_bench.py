@@ -0,0 +1,52 @@
+"""
+Benchmarks for the authentication critical paths.
+
+Covers registration, login and an authenticated request. Benchmarks are
+disabled by default and run once as plain tests; enable them with
+``pytest tests/benchmarks --benchmark-enable -n0``.
+"""
+
+from itertools import count
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures("db_session")
+
+
+def test_register_throughput(benchmark, client):
+    """Benchmark registering a new user."""
+    user_ids = count()
+
+    def register():
+        n = next(user_ids)
+        return client.post(
+            "/api/auth/register",
+            json={
+                "username": f"bench_user_{n}",
+                "email": f"bench_user_{n}@example.com",
+                "password": "benchpass123",
+                "confirm_password": "benchpass123",
+            },
+        )
+
+    response = benchmark(register)
+    assert response.status_code == 201
+
+
+def test_login_throughput(benchmark, client, registered_user):
+    """Benchmark logging in an existing user."""
+    login_data = {
+        "email": registered_user["email"],
+        "password": registered_user["password"],
+    }
+
+    response = benchmark(client.post, "/api/auth/login", json=login_data)
+    assert response.status_code == 200
+
+
+def test_protected_route_throughput(benchmark, client, access_token):
+    """Benchmark a JWT-authenticated request to a protected route."""
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = benchmark(client.get, "/api/consumption/dashboard", headers=headers)
+    assert response.status_code == 200
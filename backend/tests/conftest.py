@@ -0,0 +1,141 @@
+"""
+Shared pytest fixtures for the backend test suite.
+
+Provides a session-wide test application backed by an in-memory SQLite
+database, per-test transactional isolation and common authentication helpers.
+"""
+
+import os
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import create_app, db
+from app.config import TestingConfig
+
+# Frozen default user payload; build variants with `DEFAULT_USER | {...}`
+DEFAULT_USER = MappingProxyType(
+    {
+        "username": "testuser",
+        "email": "test@example.com",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!",
+    }
+)
+
+# Give each pytest-xdist worker its own named in-memory database
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# Overrides applied on top of TestingConfig by create_app
+TEST_CONFIG = {
+    "SQLALCHEMY_DATABASE_URI": (
+        f"sqlite:///file:memdb_{WORKER_ID}?mode=memory&cache=shared&uri=true"
+    ),
+    # One connection for the whole session, so the schema is created once
+    "SQLALCHEMY_ENGINE_OPTIONS": {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False, "uri": True},
+    },
+    "SECRET_KEY": "test-secret-key",
+    "JWT_SECRET_KEY": "test-jwt-secret-key",
+    "JWT_ACCESS_TOKEN_EXPIRES": timedelta(hours=1),
+    "JWT_REFRESH_TOKEN_EXPIRES": timedelta(days=1),
+    "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+}
+
+
+@lru_cache(maxsize=1)
+def _build_app():
+    """Create the test application and its schema exactly once per process."""
+    app = create_app(TestingConfig, **TEST_CONFIG)
+
+    with app.app_context():
+        # pysqlite's own transaction handling breaks SAVEPOINTs; let SQLAlchemy
+        # emit BEGIN itself (see the SQLAlchemy SQLite dialect documentation)
+        @event.listens_for(db.engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(db.engine, "begin")
+        def _emit_begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+        db.create_all()
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Return the test Flask application shared by the whole test session."""
+    return _build_app()
+
+
+@pytest.fixture
+def db_session(request):
+    """
+    Run each test inside a database transaction that is rolled back afterwards.
+
+    The session joins the outer transaction through SAVEPOINTs, so commits made
+    by the application only release a savepoint and never reach the database.
+    Tests marked ``no_app`` get ``None`` and never build the application; tests
+    marked ``no_db`` get ``None`` inside an app context with no connection.
+    """
+    if request.node.get_closest_marker("no_app"):
+        yield None
+        return
+
+    app = request.getfixturevalue("app")
+    if request.node.get_closest_marker("no_db"):
+        with app.app_context():
+            yield None
+        return
+
+    with app.app_context():
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        # Keep the production session defaults (expire_on_commit, autoflush)
+        session = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+        )
+        original_session = db.session
+        db.session = session
+
+        yield session
+
+        session.remove()
+        db.session = original_session
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """
+    Create a test client shared by the whole test session.
+
+    Authentication uses bearer headers rather than cookies, so the client keeps
+    no cookie jar and carries no state between tests.
+    """
+    return app.test_client(use_cookies=False)
+
+
+@pytest.fixture
+def registered_user(client, db_session):
+    """Register the default test user through the API and return its data."""
+    response = client.post("/api/auth/register", json={**DEFAULT_USER})
+    assert response.status_code == 201
+    return {**DEFAULT_USER, "id": response.get_json()["id"]}
+
+
+@pytest.fixture
+def access_token(db_session, registered_user):
+    """Mint a JWT access token for the registered user without logging in."""
+    # Same identity the login endpoint issues; db_session keeps an app context
+    return create_access_token(identity=str(registered_user["id"]))
@@ -6,42 +6,81 @@ functionality including validation, error handling, and database operations.
 """
 
 import json
-from datetime import timedelta
+from types import MappingProxyType
 
 import pytest
+from pydantic import ValidationError
 
-from app import create_app, db
+from app import db
 from app.models.user import User
+from app.schemas import UserRegistrationRequest
+from tests.conftest import DEFAULT_USER
+
+pytestmark = pytest.mark.usefixtures("db_session")
+
+# Frozen base payloads; build variants with `REGISTER_PAYLOAD | {...}`
+REGISTER_PAYLOAD = DEFAULT_USER
+
+LOGIN_PAYLOAD = MappingProxyType(
+    {"email": DEFAULT_USER["email"], "password": DEFAULT_USER["password"]}
+)
+
+WEAK_PASSWORDS = [
+    pytest.param("short", "at least 8 characters", id="too-short"),
+    pytest.param("NoNumbers!", "at least one number", id="no-number"),
+    pytest.param("12345678", "at least one letter", id="no-letter"),
+]
+
+VALID_USERNAMES = ["testuser", "test_user", "test-user", "user123", "123user"]
+
+INVALID_USERNAMES = [
+    pytest.param("user with spaces", id="space"),
+    pytest.param("user@invalid", id="at-sign"),
+    pytest.param("user#invalid", id="hash"),
+    pytest.param("", id="empty"),
+    pytest.param("ab", id="too-short"),
+]
+
+INCOMPLETE_REGISTRATIONS = [
+    pytest.param({}, id="all-missing"),
+    pytest.param({"username": "testuser"}, id="username-only"),
+    pytest.param({"email": "test@example.com"}, id="email-only"),
+    pytest.param(
+        {"username": "testuser", "email": "test@example.com"}, id="no-passwords"
+    ),
+    pytest.param(
+        {
+            "username": "testuser",
+            "email": "test@example.com",
+            "password": "SecurePass123!",
+        },
+        id="no-confirm-password",
+    ),
+]
 
 
 @pytest.fixture
-def app():
-    """Create a test Flask application."""
-    from app.config import Config
-
-    class TestConfig(Config):
-        TESTING = True
-        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
-        SECRET_KEY = "test-secret-key"
-        JWT_SECRET_KEY = "test-jwt-secret-key"
-        JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-        JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=1)
-        WTF_CSRF_ENABLED = False
-        SQLALCHEMY_TRACK_MODIFICATIONS = False
-
-    app = create_app(TestConfig)
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
+def transient_user():
+    """Return a hashed test user that is never added to the database."""
+    return User(
+        username="testuser", email="test@example.com", password="SecurePass123!"
+    )
 
 
 @pytest.fixture
-def client(app):
-    """Create a test client for the Flask application."""
-    return app.test_client()
+def seeded_user(db_session):
+    """
+    Add a hashed test user to the database session and return it.
+
+    The user is flushed rather than committed: flushing assigns the id and
+    column defaults, and the per-test rollback discards it afterwards.
+    """
+    user = User(
+        username="testuser", email="test@example.com", password="SecurePass123!"
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
 
 
 @pytest.fixture
@@ -69,18 +108,7 @@ class TestUserRegistration:
 
     def test_successful_registration(self, client):
         """Test successful user registration with valid data."""
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
-
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json={**REGISTER_PAYLOAD})
 
         assert response.status_code == 201
 
@@ -97,33 +125,17 @@ class TestUserRegistration:
 class TestLoginEndpoint:
     """Test cases for the user login endpoint."""
 
-    def test_successful_login(self, client, app):
+    def test_successful_login(self, client, registered_user):
         """Test successful user login."""
-        # First register a user
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpass123",
-            "confirm_password": "testpass123",
+        login_data = {
+            "email": registered_user["email"],
+            "password": registered_user["password"],
         }
 
-        client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
-
-        # Now test login
-        login_data = {"email": "test@example.com", "password": "testpass123"}
-
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 200
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
 
         # Check response structure
         assert "access_token" in json_response
@@ -145,97 +157,58 @@ class TestLoginEndpoint:
 
     def test_login_invalid_email(self, client):
         """Test login with non-existent email."""
-        login_data = {"email": "nonexistent@example.com", "password": "testpass123"}
+        login_data = LOGIN_PAYLOAD | {"email": "nonexistent@example.com"}
 
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "invalid_credentials"
         assert json_response["message"] == "Invalid email or password"
 
-    def test_login_invalid_password(self, client, app):
+    def test_login_invalid_password(self, client, registered_user, monkeypatch):
         """Test login with wrong password."""
-        # First register a user
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpass123",
-            "confirm_password": "testpass123",
-        }
+        # Only the endpoint's handling is under test here; bcrypt verification
+        # itself is covered by TestUserObject.test_password_hashing
+        monkeypatch.setattr(User, "check_password", lambda self, password: False)
+        login_data = {"email": registered_user["email"], "password": "wrongpassword"}
 
-        client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
-
-        # Now test login with wrong password
-        login_data = {"email": "test@example.com", "password": "wrongpassword"}
-
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "invalid_credentials"
         assert json_response["message"] == "Invalid email or password"
 
-    def test_login_inactive_user(self, client, app):
+    def test_login_inactive_user(self, client, registered_user):
         """Test login with deactivated user account."""
-        # First register a user
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpass123",
-            "confirm_password": "testpass123",
-        }
-
-        client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
-
         # Deactivate the user
-        with app.app_context():
-            user = User.find_by_email("test@example.com")
-            user.is_active = False
-            db.session.commit()
+        user = User.find_by_email(registered_user["email"])
+        user.is_active = False
+        db.session.commit()
 
-        # Now test login
-        login_data = {"email": "test@example.com", "password": "testpass123"}
+        login_data = {
+            "email": registered_user["email"],
+            "password": registered_user["password"],
+        }
 
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "inactive_account"
         assert json_response["message"] == "User account is deactivated"
 
     def test_login_missing_content_type(self, client):
         """Test login without proper content-type header."""
-        login_data = {"email": "test@example.com", "password": "testpass123"}
-
         response = client.post(
             "/api/auth/login",
-            data=json.dumps(login_data),
+            data=json.dumps({**LOGIN_PAYLOAD}),
             # Missing content_type="application/json"
         )
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "invalid_content_type"
         assert json_response["message"] == "Content-Type must be application/json"
 
@@ -248,37 +221,29 @@ class TestLoginEndpoint:
         )
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "invalid_json"
         assert json_response["message"] == "Invalid JSON payload"
 
     def test_login_validation_errors(self, client):
         """Test login with validation errors."""
         # Test missing fields
-        login_data = {"email": "test@example.com"}  # Missing password
+        login_data = {"email": LOGIN_PAYLOAD["email"]}  # Missing password
 
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "validation_error"
         assert "details" in json_response
 
         # Test invalid email format
-        login_data = {"email": "invalid-email", "password": "testpass123"}
+        login_data = LOGIN_PAYLOAD | {"email": "invalid-email"}
 
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/login", json=login_data)
 
         assert response.status_code == 400
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "validation_error"
         assert "details" in json_response
 
@@ -286,42 +251,15 @@ class TestLoginEndpoint:
 class TestProtectedRoutes:
     """Test cases for JWT-protected routes."""
 
-    def test_access_protected_route_with_valid_token(self, client, app):
+    def test_access_protected_route_with_valid_token(self, client, access_token):
         """Test accessing protected route with valid JWT token."""
-        # First register and login a user
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "testpass123",
-            "confirm_password": "testpass123",
-        }
-
-        client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
-
-        login_data = {"email": "test@example.com", "password": "testpass123"}
-
-        login_response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
-
-        assert login_response.status_code == 200
-        login_json = json.loads(login_response.data)
-        access_token = login_json["access_token"]
-
-        # Now access protected route with token
         response = client.get(
             "/api/consumption/dashboard",
             headers={"Authorization": f"Bearer {access_token}"},
         )
 
         assert response.status_code == 200
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["message"] == "Welcome to the dashboard"
         assert json_response["user"]["username"] == "testuser"
         assert json_response["user"]["email"] == "test@example.com"
@@ -331,7 +269,7 @@ class TestProtectedRoutes:
         response = client.get("/api/consumption/dashboard")
 
         assert response.status_code == 401
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "missing_token"
         assert json_response["message"] == "Authorization token is required"
 
@@ -343,39 +281,25 @@ class TestProtectedRoutes:
         )
 
         assert response.status_code == 401
-        json_response = json.loads(response.data)
+        json_response = response.get_json()
         assert json_response["error"] == "invalid_token"
 
     def test_duplicate_email_registration(self, client):
         """Test registration with an email that already exists."""
         # Create first user
-        registration_data = {
-            "username": "firstuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
+        registration_data = REGISTER_PAYLOAD | {"username": "firstuser"}
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=registration_data)
         assert response.status_code == 201
 
         # Try to register with same email
-        duplicate_data = {
+        duplicate_data = REGISTER_PAYLOAD | {
             "username": "seconduser",
-            "email": "test@example.com",  # Same email
             "password": "AnotherPass123!",
             "confirm_password": "AnotherPass123!",
         }
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(duplicate_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=duplicate_data)
 
         assert response.status_code == 400
 
@@ -387,33 +311,19 @@ class TestProtectedRoutes:
     def test_duplicate_username_registration(self, client):
         """Test registration with a username that already exists."""
         # Create first user
-        registration_data = {
-            "username": "testuser",
-            "email": "first@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
+        registration_data = REGISTER_PAYLOAD | {"email": "first@example.com"}
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=registration_data)
         assert response.status_code == 201
 
         # Try to register with same username
-        duplicate_data = {
-            "username": "testuser",  # Same username
+        duplicate_data = REGISTER_PAYLOAD | {
             "email": "second@example.com",
             "password": "AnotherPass123!",
             "confirm_password": "AnotherPass123!",
         }
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(duplicate_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=duplicate_data)
 
         assert response.status_code == 400
 
@@ -424,18 +334,9 @@ class TestProtectedRoutes:
 
     def test_password_mismatch_validation(self, client):
         """Test registration with password and confirm_password that don't match."""
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "DifferentPass123!",
-        }
+        registration_data = REGISTER_PAYLOAD | {"confirm_password": "DifferentPass123!"}
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=registration_data)
 
         assert response.status_code == 400
 
@@ -445,116 +346,28 @@ class TestProtectedRoutes:
         assert data["message"] == "Request validation failed"
         assert "Password and confirm password do not match" in str(data["details"])
 
-    def test_invalid_email_validation(self, client):
-        """Test registration with invalid email format."""
-        registration_data = {
-            "username": "testuser",
-            "email": "invalid-email-format",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
+    def test_invalid_username_message(self, client):
+        """Test that a malformed username gets the readable error message."""
+        registration_data = REGISTER_PAYLOAD | {"username": "user@invalid"}
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
+        response = client.post("/api/auth/register", json=registration_data)
+
+        assert response.status_code == 400
+        assert response.get_json()["details"]["username"] == (
+            "Value error, Username can only contain letters, numbers, "
+            "underscores, and hyphens"
         )
 
+    @pytest.mark.parametrize("registration_data", INCOMPLETE_REGISTRATIONS)
+    def test_missing_required_fields(self, client, registration_data):
+        """Test registration with missing required fields."""
+        response = client.post("/api/auth/register", json=registration_data)
+
         assert response.status_code == 400
 
         data = response.get_json()
         assert data is not None
         assert data["error"] == "validation_error"
-        assert data["message"] == "Request validation failed"
-        assert "email" in data["details"]
-
-    def test_weak_password_validation(self, client):
-        """Test registration with passwords that don't meet strength requirements."""
-        test_cases = [
-            {"password": "short", "expected_error": "at least 8 characters"},
-            {"password": "NoNumbers!", "expected_error": "at least one number"},
-            {"password": "12345678", "expected_error": "at least one letter"},
-        ]
-
-        for case in test_cases:
-            registration_data = {
-                "username": "testuser",
-                "email": "test@example.com",
-                "password": case["password"],
-                "confirm_password": case["password"],
-            }
-
-            response = client.post(
-                "/api/auth/register",
-                data=json.dumps(registration_data),
-                content_type="application/json",
-            )
-
-            assert response.status_code == 400
-
-            data = response.get_json()
-            assert data is not None
-            assert data["error"] == "validation_error"
-            assert case["expected_error"] in str(data["details"])
-
-    def test_invalid_username_validation(self, client):
-        """Test registration with invalid username formats."""
-        test_cases = [
-            "user with spaces",
-            "user@invalid",
-            "user#invalid",
-            "",
-            "ab",  # Too short
-        ]
-
-        for username in test_cases:
-            registration_data = {
-                "username": username,
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "confirm_password": "SecurePass123!",
-            }
-
-            response = client.post(
-                "/api/auth/register",
-                data=json.dumps(registration_data),
-                content_type="application/json",
-            )
-
-            assert response.status_code == 400
-
-            data = response.get_json()
-            assert data is not None
-            assert data["error"] == "validation_error"
-
-    def test_missing_required_fields(self, client):
-        """Test registration with missing required fields."""
-        test_cases = [
-            {},  # All fields missing
-            {"username": "testuser"},  # Missing email, password, confirm_password
-            {
-                "email": "test@example.com"
-            },  # Missing username, password, confirm_password
-            {"username": "testuser", "email": "test@example.com"},  # Missing passwords
-            {
-                "username": "testuser",
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-            },  # Missing confirm_password
-        ]
-
-        for registration_data in test_cases:
-            response = client.post(
-                "/api/auth/register",
-                data=json.dumps(registration_data),
-                content_type="application/json",
-            )
-
-            assert response.status_code == 400
-
-            data = response.get_json()
-            assert data is not None
-            assert data["error"] == "validation_error"
 
     def test_invalid_json_payload(self, client):
         """Test registration with invalid JSON payload."""
@@ -571,16 +384,9 @@ class TestProtectedRoutes:
 
     def test_missing_content_type(self, client):
         """Test registration without proper content type header."""
-        registration_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
-
         response = client.post(
             "/api/auth/register",
-            data=json.dumps(registration_data),
+            data=json.dumps({**REGISTER_PAYLOAD}),
             # Missing content_type="application/json"
         )
 
@@ -596,150 +402,135 @@ class TestProtectedRoutes:
 class TestUserModel:
     """Test cases for the User model."""
 
-    def test_user_creation(self, app):
+    def test_user_find_methods(self, seeded_user, db_session):
+        """Test User model class methods for finding users."""
+        # Other users in the table, inserted in one batch
+        db_session.bulk_save_objects(
+            [
+                User(
+                    username=f"otheruser{n}",
+                    email=f"other{n}@example.com",
+                    password="SecurePass123!",
+                )
+                for n in range(3)
+            ]
+        )
+        db_session.flush()
+
+        # Test find_by_email
+        found_user = User.find_by_email("test@example.com")
+        assert found_user is not None
+        assert found_user.username == "testuser"
+
+        # Test find_by_email case insensitive
+        found_user = User.find_by_email("TEST@EXAMPLE.COM")
+        assert found_user is not None
+
+        # Test find_by_username
+        found_user = User.find_by_username("testuser")
+        assert found_user is not None
+        assert found_user.email == "test@example.com"
+
+        # Test not found
+        assert User.find_by_email("notfound@example.com") is None
+        assert User.find_by_username("notfound") is None
+
+    def test_user_to_dict(self, seeded_user):
+        """Test User model to_dict method."""
+        # Test without sensitive data
+        data = seeded_user.to_dict()
+        assert "id" in data
+        assert data["username"] == "testuser"
+        assert data["email"] == "test@example.com"
+        assert data["is_active"] is True
+        assert "created_at" in data
+        assert "updated_at" in data
+        assert "password_hash" not in data
+
+        # Test with sensitive data
+        data_with_sensitive = seeded_user.to_dict(include_sensitive=True)
+        assert "password_hash" in data_with_sensitive
+
+
+@pytest.mark.no_db
+class TestUserObject:
+    """Test cases for User behaviour that needs no database."""
+
+    def test_user_creation(self, transient_user):
         """Test User model creation and basic functionality."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="test@example.com", password="SecurePass123!"
-            )
-
-            assert user.username == "testuser"
-            assert user.email == "test@example.com"
-            assert user.password_hash is not None
-            assert user.password_hash != "SecurePass123!"  # Should be hashed
-            assert user.is_active is True
-
-    def test_password_hashing(self, app):
-        """Test password hashing and verification."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="test@example.com", password="SecurePass123!"
-            )
+        assert transient_user.username == "testuser"
+        assert transient_user.email == "test@example.com"
+        assert transient_user.password_hash is not None
+        assert transient_user.password_hash != "SecurePass123!"  # Should be hashed
+        assert transient_user.is_active is True
 
-            # Password should be hashed
-            assert user.password_hash != "SecurePass123!"
+    def test_password_hashing(self, transient_user):
+        """Test password hashing and verification."""
+        # Password should be hashed
+        assert transient_user.password_hash != "SecurePass123!"
 
-            # Password verification should work
-            assert user.check_password("SecurePass123!") is True
-            assert user.check_password("WrongPassword") is False
+        # Password verification should work
+        assert transient_user.check_password("SecurePass123!") is True
+        assert transient_user.check_password("WrongPassword") is False
 
-    def test_email_normalization(self, app):
+    def test_email_normalization(self):
         """Test that email addresses are normalized to lowercase."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="Test@EXAMPLE.COM", password="SecurePass123!"
-            )
+        user = User(
+            username="testuser", email="Test@EXAMPLE.COM", password="SecurePass123!"
+        )
 
-            assert user.email == "test@example.com"
+        assert user.email == "test@example.com"
 
-    def test_user_find_methods(self, app):
-        """Test User model class methods for finding users."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="test@example.com", password="SecurePass123!"
-            )
-            db.session.add(user)
-            db.session.commit()
-
-            # Test find_by_email
-            found_user = User.find_by_email("test@example.com")
-            assert found_user is not None
-            assert found_user.username == "testuser"
-
-            # Test find_by_email case insensitive
-            found_user = User.find_by_email("TEST@EXAMPLE.COM")
-            assert found_user is not None
-
-            # Test find_by_username
-            found_user = User.find_by_username("testuser")
-            assert found_user is not None
-            assert found_user.email == "test@example.com"
-
-            # Test not found
-            assert User.find_by_email("notfound@example.com") is None
-            assert User.find_by_username("notfound") is None
-
-    def test_user_to_dict(self, app):
-        """Test User model to_dict method."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="test@example.com", password="SecurePass123!"
-            )
-            db.session.add(user)
-            db.session.commit()
-
-            # Test without sensitive data
-            data = user.to_dict()
-            assert "id" in data
-            assert data["username"] == "testuser"
-            assert data["email"] == "test@example.com"
-            assert data["is_active"] is True
-            assert "created_at" in data
-            assert "updated_at" in data
-            assert "password_hash" not in data
-
-            # Test with sensitive data
-            data_with_sensitive = user.to_dict(include_sensitive=True)
-            assert "password_hash" in data_with_sensitive
-
-    def test_user_repr(self, app):
+    def test_user_repr(self, transient_user):
         """Test User model string representation."""
-        with app.app_context():
-            user = User(
-                username="testuser", email="test@example.com", password="SecurePass123!"
-            )
-
-            repr_str = repr(user)
-            assert "testuser" in repr_str
-            assert "test@example.com" in repr_str
+        repr_str = repr(transient_user)
+        assert "testuser" in repr_str
+        assert "test@example.com" in repr_str
 
 
+@pytest.mark.no_app
 class TestUserRegistrationSchema:
     """Test cases for the UserRegistrationRequest schema."""
 
     def test_valid_schema_validation(self):
         """Test schema validation with valid data."""
-        from app.schemas import UserRegistrationRequest
-
-        valid_data = {
-            "username": "testuser",
-            "email": "test@example.com",
-            "password": "SecurePass123!",
-            "confirm_password": "SecurePass123!",
-        }
-
-        schema = UserRegistrationRequest.model_validate(valid_data)
+        schema = UserRegistrationRequest.model_validate({**REGISTER_PAYLOAD})
         assert schema.username == "testuser"
         assert schema.email == "test@example.com"
         assert schema.password == "SecurePass123!"
         assert schema.confirm_password == "SecurePass123!"
 
-    def test_username_validation(self):
-        """Test username validation rules."""
-        from pydantic import ValidationError
-
-        from app.schemas import UserRegistrationRequest
-
-        # Test valid usernames
-        valid_usernames = ["testuser", "test_user", "test-user", "user123", "123user"]
-        for username in valid_usernames:
-            data = {
-                "username": username,
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "confirm_password": "SecurePass123!",
-            }
-            schema = UserRegistrationRequest.model_validate(data)
-            assert schema.username == username.lower()
-
-        # Test invalid usernames
-        invalid_usernames = ["test user", "test@user", "test#user", ""]
-        for username in invalid_usernames:
-            data = {
-                "username": username,
-                "email": "test@example.com",
-                "password": "SecurePass123!",
-                "confirm_password": "SecurePass123!",
-            }
-            with pytest.raises(ValidationError):
-                UserRegistrationRequest.model_validate(data)
+    @pytest.mark.parametrize("username", VALID_USERNAMES)
+    def test_valid_username(self, username):
+        """Test that well-formed usernames are accepted and lowercased."""
+        data = REGISTER_PAYLOAD | {"username": username}
+        schema = UserRegistrationRequest.model_validate(data)
+        assert schema.username == username.lower()
+
+    @pytest.mark.parametrize("username", INVALID_USERNAMES)
+    def test_invalid_username(self, username):
+        """Test that malformed usernames are rejected."""
+        data = REGISTER_PAYLOAD | {"username": username}
+        with pytest.raises(ValidationError):
+            UserRegistrationRequest.model_validate(data)
+
+    def test_invalid_email(self):
+        """Test that a malformed email address is rejected."""
+        data = REGISTER_PAYLOAD | {"email": "invalid-email-format"}
+        with pytest.raises(ValidationError, match="email"):
+            UserRegistrationRequest.model_validate(data)
+
+    @pytest.mark.parametrize("password,expected_error", WEAK_PASSWORDS)
+    def test_weak_password(self, password, expected_error):
+        """Test that passwords not meeting strength requirements are rejected."""
+        data = REGISTER_PAYLOAD | {"password": password, "confirm_password": password}
+        with pytest.raises(ValidationError, match=expected_error):
+            UserRegistrationRequest.model_validate(data)
+
+    def test_password_mismatch(self):
+        """Test that differing password and confirm_password are rejected."""
+        data = REGISTER_PAYLOAD | {"confirm_password": "DifferentPass123!"}
+        with pytest.raises(
+            ValidationError, match="Password and confirm password do not match"
+        ):
+            UserRegistrationRequest.model_validate(data)
@@ -5,46 +5,17 @@ This module contains integration tests that test the complete flow
 from HTTP request to database storage.
 """
 
-import json
-
 import pytest
 
-from app import create_app, db
 from app.models.user import User
 
-
-@pytest.fixture
-def app():
-    """Create a test Flask application for integration tests."""
-    from app.config import Config
-
-    class TestConfig(Config):
-        TESTING = True
-        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
-        SECRET_KEY = "test-secret-key"
-        JWT_SECRET_KEY = "test-jwt-secret-key"
-        WTF_CSRF_ENABLED = False
-        SQLALCHEMY_TRACK_MODIFICATIONS = False
-
-    app = create_app(TestConfig)
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
-
-
-@pytest.fixture
-def client(app):
-    """Create a test client for integration tests."""
-    return app.test_client()
+pytestmark = pytest.mark.usefixtures("db_session")
 
 
 class TestRegistrationIntegration:
     """Integration tests for user registration."""
 
-    def test_full_registration_flow(self, client, app):
+    def test_full_registration_flow(self, client):
         """Test the complete registration flow from API to database."""
         # Test data
         registration_data = {
@@ -55,11 +26,7 @@ class TestRegistrationIntegration:
         }
 
         # Step 1: Make registration request
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=registration_data)
 
         # Step 2: Verify API response
         assert response.status_code == 201
@@ -74,30 +41,26 @@ class TestRegistrationIntegration:
         assert response_data["message"] == "User registered successfully"
 
         # Step 3: Verify database persistence
-        with app.app_context():
-            user = User.query.filter_by(email="integration@example.com").first()
-            assert user is not None
-            assert user.username == "integrationuser"
-            assert user.email == "integration@example.com"
-            assert user.is_active is True
-            assert user.password_hash is not None
-            assert (
-                user.password_hash != "IntegrationPass123!"
-            )  # Password should be hashed
-            assert user.check_password("IntegrationPass123!") is True
-            assert user.check_password("WrongPassword") is False
+        user = User.query.filter_by(email="integration@example.com").first()
+        assert user is not None
+        assert user.username == "integrationuser"
+        assert user.email == "integration@example.com"
+        assert user.is_active is True
+        assert user.password_hash is not None
+        assert user.password_hash != "IntegrationPass123!"  # Password should be hashed
+        assert user.check_password("IntegrationPass123!") is True
+        assert user.check_password("WrongPassword") is False
 
         # Step 4: Verify user can be found using model methods
-        with app.app_context():
-            found_by_email = User.find_by_email("integration@example.com")
-            assert found_by_email is not None
-            assert found_by_email.id == user.id
+        found_by_email = User.find_by_email("integration@example.com")
+        assert found_by_email is not None
+        assert found_by_email.id == user.id
 
-            found_by_username = User.find_by_username("integrationuser")
-            assert found_by_username is not None
-            assert found_by_username.id == user.id
+        found_by_username = User.find_by_username("integrationuser")
+        assert found_by_username is not None
+        assert found_by_username.id == user.id
 
-    def test_registration_prevents_duplicate_users(self, client, app):
+    def test_registration_prevents_duplicate_users(self, client):
         """Test that registration prevents creating duplicate users."""
         registration_data = {
             "username": "duplicatetest",
@@ -107,11 +70,7 @@ class TestRegistrationIntegration:
         }
 
         # Register first user
-        response1 = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response1 = client.post("/api/auth/register", json=registration_data)
         assert response1.status_code == 201
 
         # Try to register with same email
@@ -122,11 +81,7 @@ class TestRegistrationIntegration:
             "confirm_password": "DifferentPass123!",
         }
 
-        response2 = client.post(
-            "/api/auth/register",
-            data=json.dumps(duplicate_email_data),
-            content_type="application/json",
-        )
+        response2 = client.post("/api/auth/register", json=duplicate_email_data)
         assert response2.status_code == 400
 
         # Try to register with same username
@@ -137,21 +92,16 @@ class TestRegistrationIntegration:
             "confirm_password": "DifferentPass123!",
         }
 
-        response3 = client.post(
-            "/api/auth/register",
-            data=json.dumps(duplicate_username_data),
-            content_type="application/json",
-        )
+        response3 = client.post("/api/auth/register", json=duplicate_username_data)
         assert response3.status_code == 400
 
         # Verify only one user exists in database
-        with app.app_context():
-            users = User.query.all()
-            assert len(users) == 1
-            assert users[0].username == "duplicatetest"
-            assert users[0].email == "duplicate@example.com"
+        users = User.query.all()
+        assert len(users) == 1
+        assert users[0].username == "duplicatetest"
+        assert users[0].email == "duplicate@example.com"
 
-    def test_registration_with_case_insensitive_email(self, client, app):
+    def test_registration_with_case_insensitive_email(self, client):
         """Test that email case is normalized and duplicate detection works
         case-insensitively."""
         # Register with uppercase email
@@ -162,17 +112,12 @@ class TestRegistrationIntegration:
             "confirm_password": "CasePass123!",
         }
 
-        response = client.post(
-            "/api/auth/register",
-            data=json.dumps(registration_data),
-            content_type="application/json",
-        )
+        response = client.post("/api/auth/register", json=registration_data)
         assert response.status_code == 201
 
         # Verify email is stored in lowercase
-        with app.app_context():
-            user = User.query.first()
-            assert user.email == "casetest@example.com"  # Should be lowercase
+        user = User.query.first()
+        assert user.email == "casetest@example.com"  # Should be lowercase
 
         # Try to register with same email in different case
         duplicate_data = {
@@ -182,17 +127,13 @@ class TestRegistrationIntegration:
             "confirm_password": "AnotherPass123!",
         }
 
-        response2 = client.post(
-            "/api/auth/register",
-            data=json.dumps(duplicate_data),
-            content_type="application/json",
-        )
+        response2 = client.post("/api/auth/register", json=duplicate_data)
         assert response2.status_code == 400
 
         data = response2.get_json()
         assert data["error"] == "email_exists"
 
-    def test_multiple_successful_registrations(self, client, app):
+    def test_multiple_successful_registrations(self, client):
         """Test that multiple users can be registered successfully."""
         users_data = [
             {
@@ -217,35 +158,30 @@ class TestRegistrationIntegration:
 
         # Register all users
         for user_data in users_data:
-            response = client.post(
-                "/api/auth/register",
-                data=json.dumps(user_data),
-                content_type="application/json",
-            )
+            response = client.post("/api/auth/register", json=user_data)
             assert response.status_code == 201
 
         # Verify all users exist in database
-        with app.app_context():
-            users = User.query.all()
-            assert len(users) == 3
-
-            usernames = {user.username for user in users}
-            emails = {user.email for user in users}
-
-            assert usernames == {"user1", "user2", "user3"}
-            assert emails == {
-                "user1@example.com",
-                "user2@example.com",
-                "user3@example.com",
-            }
-
-            # Verify all passwords work
-            password_map = {
-                "user1": "Pass123!",
-                "user2": "Pass456!",
-                "user3": "Pass789!",
-            }
-
-            for user in users:
-                expected_password = password_map[user.username]
-                assert user.check_password(expected_password) is True
+        users = User.query.all()
+        assert len(users) == 3
+
+        usernames = {user.username for user in users}
+        emails = {user.email for user in users}
+
+        assert usernames == {"user1", "user2", "user3"}
+        assert emails == {
+            "user1@example.com",
+            "user2@example.com",
+            "user3@example.com",
+        }
+
+        # Verify all passwords work
+        password_map = {
+            "user1": "Pass123!",
+            "user2": "Pass456!",
+            "user3": "Pass789!",
+        }
+
+        for user in users:
+            expected_password = password_map[user.username]
+            assert user.check_password(expected_password) is True
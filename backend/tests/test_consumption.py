@@ -5,66 +5,62 @@ This module contains comprehensive tests for consumption data management
 functionality including creation, validation, error handling, and user access control.
 """
 
-import json
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from types import MappingProxyType
 
 import pytest
+from flask_jwt_extended import create_access_token
+from pydantic import ValidationError
 
-from app import create_app, db
+from app import db
 from app.models.consumption import Consumption
 from app.models.user import User
+from app.schemas import ConsumptionCreateRequest
 
+pytestmark = pytest.mark.usefixtures("db_session")
 
-@pytest.fixture
-def app():
-    """Create a test Flask application."""
-    from app.config import Config
-
-    class TestConfig(Config):
-        TESTING = True
-        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
-        SECRET_KEY = "test-secret-key"
-        JWT_SECRET_KEY = "test-jwt-secret-key"
-        JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=1)
-        JWT_REFRESH_TOKEN_EXPIRES = timedelta(days=1)
-        WTF_CSRF_ENABLED = False
-        SQLALCHEMY_TRACK_MODIFICATIONS = False
-
-    app = create_app(TestConfig)
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        db.session.remove()
-        db.drop_all()
+# Frozen base payload; build variants with `CONSUMPTION_PAYLOAD | {...}`
+CONSUMPTION_PAYLOAD = MappingProxyType(
+    {"date": "2023-10-15T10:00:00Z", "value": 100.0, "type": "electricity"}
+)
 
 
 @pytest.fixture
-def client(app):
-    """Create a test client."""
-    return app.test_client()
-
-
-@pytest.fixture
-def test_user(app):
+def test_user(db_session):
     """Create a test user."""
     user = User(
         username="testuser", email="test@example.com", password="testpassword123"
     )
-    db.session.add(user)
-    db.session.commit()
+    db_session.add(user)
+    db_session.flush()
     return user
 
 
+def consumption_rows(user, count):
+    """Build insert mappings for ``count`` daily electricity readings."""
+    return [
+        {
+            "user_id": user.id,
+            "date": datetime(2023, 10, i + 1, 10, tzinfo=timezone.utc),
+            "value": 100.0 + i,
+            "type": "electricity",
+            "notes": f"Test consumption {i + 1}",
+        }
+        for i in range(count)
+    ]
+
+
+def bearer_headers(user):
+    """Return Authorization headers with a freshly minted token for ``user``."""
+    # Same identity the login endpoint issues; login itself is tested in test_auth
+    token = create_access_token(identity=str(user.id))
+    return {"Authorization": f"Bearer {token}"}
+
+
 @pytest.fixture
-def auth_headers(client, test_user):
+def auth_headers(test_user):
     """Get authorization headers for test user."""
-    login_data = {"email": "test@example.com", "password": "testpassword123"}
-    response = client.post(
-        "/api/auth/login", data=json.dumps(login_data), content_type="application/json"
-    )
-    token = response.json["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return bearer_headers(test_user)
 
 
 class TestConsumptionCreation:
@@ -72,18 +68,13 @@ class TestConsumptionCreation:
 
     def test_create_consumption_success(self, client, auth_headers):
         """Test successful consumption record creation."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
+        consumption_data = CONSUMPTION_PAYLOAD | {
             "value": 150.75,
-            "type": "electricity",
             "notes": "Monthly reading",
         }
 
         response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+            "/api/consumption", json=consumption_data, headers=auth_headers
         )
 
         assert response.status_code == 201
@@ -100,17 +91,10 @@ class TestConsumptionCreation:
 
     def test_create_consumption_minimum_required_fields(self, client, auth_headers):
         """Test creating consumption with only required fields."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 100.0,
-            "type": "water",
-        }
+        consumption_data = CONSUMPTION_PAYLOAD | {"type": "water"}
 
         response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+            "/api/consumption", json=consumption_data, headers=auth_headers
         )
 
         assert response.status_code == 201
@@ -120,169 +104,105 @@ class TestConsumptionCreation:
         assert consumption["type"] == "water"
         assert consumption["notes"] is None
 
-    def test_create_consumption_all_types(self, client, auth_headers):
+    @pytest.mark.parametrize("consumption_type", ["electricity", "water", "gas"])
+    def test_create_consumption_all_types(self, client, auth_headers, consumption_type):
         """Test creating consumption records for all valid types."""
-        types = ["electricity", "water", "gas"]
-
-        for consumption_type in types:
-            consumption_data = {
-                "date": "2023-10-15T10:00:00Z",
-                "value": 50.0,
-                "type": consumption_type,
-            }
-
-            response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=auth_headers,
-            )
-
-            assert response.status_code == 201
-            data = response.json
-            assert data["consumption"]["type"] == consumption_type
-
-
-class TestConsumptionValidation:
-    """Test consumption data validation."""
-
-    def test_missing_required_fields(self, client, auth_headers):
-        """Test validation when required fields are missing."""
-        test_cases = [
-            # Missing date
-            {"value": 100.0, "type": "electricity"},
-            # Missing value
-            {"date": "2023-10-15T10:00:00Z", "type": "water"},
-            # Missing type
-            {"date": "2023-10-15T10:00:00Z", "value": 100.0},
-            # Empty data
-            {},
-        ]
-
-        for consumption_data in test_cases:
-            response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=auth_headers,
-            )
-
-            assert response.status_code == 400
-            data = response.json
-            assert data["error"] == "validation_error"
-            assert "details" in data
-
-    def test_invalid_consumption_type(self, client, auth_headers):
-        """Test validation with invalid consumption type."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 100.0,
-            "type": "invalid_type",
-        }
-
-        response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 400
-        data = response.json
-        assert data["error"] == "validation_error"
-        assert "type" in data["details"]
-
-    def test_negative_value(self, client, auth_headers):
-        """Test validation with negative consumption value."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": -50.0,
-            "type": "electricity",
+        consumption_data = CONSUMPTION_PAYLOAD | {
+            "value": 50.0,
+            "type": consumption_type,
         }
 
         response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+            "/api/consumption", json=consumption_data, headers=auth_headers
         )
 
-        assert response.status_code == 400
+        assert response.status_code == 201
         data = response.json
-        assert data["error"] == "validation_error"
-        assert "value" in data["details"]
+        assert data["consumption"]["type"] == consumption_type
 
-    def test_zero_value(self, client, auth_headers):
-        """Test validation with zero consumption value."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 0.0,
-            "type": "water",
-        }
 
-        response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
-        )
-
-        assert response.status_code == 400
-        data = response.json
-        assert data["error"] == "validation_error"
+class TestConsumptionValidation:
+    """Test consumption data validation."""
 
-    def test_future_date(self, client, auth_headers):
-        """Test validation with future date."""
-        future_date = (datetime.now() + timedelta(days=1)).isoformat() + "Z"
-        consumption_data = {"date": future_date, "value": 100.0, "type": "gas"}
+    def test_validation_error_response(self, client, auth_headers):
+        """Test that schema errors surface as a validation_error response."""
+        consumption_data = CONSUMPTION_PAYLOAD | {"type": "invalid_type"}
 
         response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+            "/api/consumption", json=consumption_data, headers=auth_headers
         )
 
         assert response.status_code == 400
         data = response.json
         assert data["error"] == "validation_error"
-        assert "date" in data["details"]
-
-    def test_invalid_date_format(self, client, auth_headers):
-        """Test validation with invalid date format."""
-        consumption_data = {"date": "not-a-date", "value": 100.0, "type": "electricity"}
-
-        response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
-        )
+        assert "type" in data["details"]
 
-        assert response.status_code == 400
-        data = response.json
-        assert data["error"] == "validation_error"
 
-    def test_long_notes(self, client, auth_headers):
-        """Test validation with notes exceeding maximum length."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 100.0,
-            "type": "electricity",
-            "notes": "x" * 501,  # Exceeds 500 character limit
-        }
+@pytest.mark.no_app
+class TestConsumptionCreateSchema:
+    """Test cases for the ConsumptionCreateRequest schema."""
 
-        response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+    def test_valid_payload(self):
+        """Test that a valid payload is accepted and its type normalized."""
+        schema = ConsumptionCreateRequest.model_validate(
+            CONSUMPTION_PAYLOAD | {"type": "Electricity"}
         )
+        assert schema.value == 100.0
+        assert schema.type == "electricity"
+        assert schema.notes is None
+
+    @pytest.mark.parametrize(
+        "consumption_data,field",
+        [
+            pytest.param({"value": 100.0, "type": "electricity"}, "date", id="no-date"),
+            pytest.param(
+                {"date": "2023-10-15T10:00:00Z", "type": "water"},
+                "value",
+                id="no-value",
+            ),
+            pytest.param(
+                {"date": "2023-10-15T10:00:00Z", "value": 100.0}, "type", id="no-type"
+            ),
+            pytest.param({}, "date", id="empty"),
+            pytest.param(
+                CONSUMPTION_PAYLOAD | {"type": "invalid"},
+                "type",
+                id="invalid-type",
+            ),
+            pytest.param(
+                CONSUMPTION_PAYLOAD | {"value": -50.0},
+                "value",
+                id="negative-value",
+            ),
+            pytest.param(
+                CONSUMPTION_PAYLOAD | {"value": 0.0},
+                "value",
+                id="zero-value",
+            ),
+            pytest.param(
+                CONSUMPTION_PAYLOAD | {"date": "2999-01-01T00:00:00Z"},
+                "date",
+                id="future-date",
+            ),
+            pytest.param(
+                CONSUMPTION_PAYLOAD | {"date": "not-a-date"},
+                "date",
+                id="invalid-date",
+            ),
+            pytest.param(
+                # Exceeds 500 character limit
+                CONSUMPTION_PAYLOAD | {"notes": "x" * 501},
+                "notes",
+                id="long-notes",
+            ),
+        ],
+    )
+    def test_invalid_payload(self, consumption_data, field):
+        """Test that invalid payloads are rejected on the offending field."""
+        with pytest.raises(ValidationError) as exc_info:
+            ConsumptionCreateRequest.model_validate(consumption_data)
 
-        assert response.status_code == 400
-        data = response.json
-        assert data["error"] == "validation_error"
-        assert "notes" in data["details"]
+        assert field in {error["loc"][0] for error in exc_info.value.errors()}
 
 
 class TestConsumptionAuthentication:
@@ -290,39 +210,27 @@ class TestConsumptionAuthentication:
 
     def test_create_consumption_without_token(self, client):
         """Test creating consumption without authentication token."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 100.0,
-            "type": "electricity",
-        }
+        consumption_data = {**CONSUMPTION_PAYLOAD}
 
         response = client.post(
             "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
+            json=consumption_data,
         )
 
         assert response.status_code == 401
 
     def test_create_consumption_with_invalid_token(self, client):
         """Test creating consumption with invalid authentication token."""
-        consumption_data = {
-            "date": "2023-10-15T10:00:00Z",
-            "value": 100.0,
-            "type": "electricity",
-        }
+        consumption_data = {**CONSUMPTION_PAYLOAD}
 
         headers = {"Authorization": "Bearer invalid_token"}
         response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=headers,
+            "/api/consumption", json=consumption_data, headers=headers
         )
 
         assert response.status_code == 401  # JWT validation error
 
-    def test_create_consumption_inactive_user(self, client, app):
+    def test_create_consumption_inactive_user(self, client):
         """Test creating consumption with inactive user account."""
         # Create inactive user
         user = User(
@@ -334,36 +242,18 @@ class TestConsumptionAuthentication:
         db.session.add(user)
         db.session.commit()
 
-        # Get token for inactive user
-        login_data = {"email": "inactive@example.com", "password": "testpassword123"}
-        response = client.post(
-            "/api/auth/login",
-            data=json.dumps(login_data),
-            content_type="application/json",
-        )
-        # Login should fail for inactive user, but let's test the
-        # consumption endpoint too
-
-        if response.status_code == 200:
-            token = response.json["access_token"]
-            headers = {"Authorization": f"Bearer {token}"}
+        # Login refuses inactive users, so mint a token to reach the endpoint
+        headers = bearer_headers(user)
 
-            consumption_data = {
-                "date": "2023-10-15T10:00:00Z",
-                "value": 100.0,
-                "type": "electricity",
-            }
+        consumption_data = {**CONSUMPTION_PAYLOAD}
 
-            response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=headers,
-            )
+        response = client.post(
+            "/api/consumption", json=consumption_data, headers=headers
+        )
 
-            assert response.status_code == 401
-            data = response.json
-            assert data["error"] == "inactive_user"
+        assert response.status_code == 401
+        data = response.json
+        assert data["error"] == "inactive_user"
 
 
 class TestConsumptionErrorHandling:
@@ -396,7 +286,7 @@ class TestConsumptionErrorHandling:
 class TestConsumptionModel:
     """Test the Consumption model functionality."""
 
-    def test_consumption_creation(self, app, test_user):
+    def test_consumption_creation(self, test_user):
         """Test creating a consumption model instance."""
         consumption_date = datetime.now(timezone.utc)
         consumption = Consumption(
@@ -416,7 +306,7 @@ class TestConsumptionModel:
         assert consumption.type == "electricity"
         assert consumption.notes == "Test consumption"
 
-    def test_consumption_to_dict(self, app, test_user):
+    def test_consumption_to_dict(self, test_user):
         """Test consumption to_dict method."""
         consumption_date = datetime.now(timezone.utc)
         consumption = Consumption(
@@ -439,7 +329,7 @@ class TestConsumptionModel:
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_consumption_relationship(self, app, test_user):
+    def test_consumption_relationship(self, test_user):
         """Test consumption-user relationship."""
         consumption = Consumption(
             user_id=test_user.id,
@@ -501,10 +391,7 @@ class TestConsumptionList:
 
         # Create the record
         create_response = client.post(
-            "/api/consumption",
-            data=json.dumps(consumption_data),
-            content_type="application/json",
-            headers=auth_headers,
+            "/api/consumption", json=consumption_data, headers=auth_headers
         )
         assert create_response.status_code == 201
 
@@ -532,21 +419,8 @@ class TestConsumptionList:
     ):
         """Test listing consumption records with pagination."""
         # Create multiple consumption records
-        for i in range(25):
-            consumption_data = {
-                "date": f"2023-10-{str(i+1).zfill(2)}T10:00:00Z",
-                "value": 100.0 + i,
-                "type": "electricity",
-                "notes": f"Test consumption {i+1}",
-            }
-
-            create_response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=auth_headers,
-            )
-            assert create_response.status_code == 201
+        db.session.bulk_insert_mappings(Consumption, consumption_rows(test_user, 25))
+        db.session.commit()
 
         # Test first page (default)
         response = client.get("/api/consumption", headers=auth_headers)
@@ -574,21 +448,8 @@ class TestConsumptionList:
     def test_list_custom_per_page(self, client, auth_headers, test_user):
         """Test listing consumption records with custom per_page parameter."""
         # Create 15 consumption records
-        for i in range(15):
-            consumption_data = {
-                "date": f"2023-10-{str(i+1).zfill(2)}T10:00:00Z",
-                "value": 100.0 + i,
-                "type": "electricity",
-                "notes": f"Test consumption {i+1}",
-            }
-
-            create_response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=auth_headers,
-            )
-            assert create_response.status_code == 201
+        db.session.bulk_insert_mappings(Consumption, consumption_rows(test_user, 15))
+        db.session.commit()
 
         # Test custom per_page
         response = client.get("/api/consumption?per_page=5", headers=auth_headers)
@@ -619,92 +480,62 @@ class TestConsumptionList:
         data = response.json
         assert data["pagination"]["per_page"] == 20  # Should default to 20
 
-    def test_list_user_isolation(self, client, app):
+    def test_list_user_isolation(self, client):
         """Test that users only see their own consumption records."""
-        with app.app_context():
-            # Create two test users
-            user1 = User(
-                username="user1", email="user1@example.com", password="password123"
-            )
-            user1.set_password("password123")
-            user2 = User(
-                username="user2", email="user2@example.com", password="password123"
-            )
-            user2.set_password("password123")
-
-            db.session.add(user1)
-            db.session.add(user2)
-            db.session.commit()
-
-            # Login as user1
-            login_response1 = client.post(
-                "/api/auth/login",
-                data=json.dumps(
-                    {"email": "user1@example.com", "password": "password123"}
-                ),
-                content_type="application/json",
-            )
-            assert login_response1.status_code == 200
-            token1 = login_response1.json["access_token"]
-            headers1 = {"Authorization": f"Bearer {token1}"}
-
-            # Login as user2
-            login_response2 = client.post(
-                "/api/auth/login",
-                data=json.dumps(
-                    {"email": "user2@example.com", "password": "password123"}
-                ),
-                content_type="application/json",
-            )
-            assert login_response2.status_code == 200
-            token2 = login_response2.json["access_token"]
-            headers2 = {"Authorization": f"Bearer {token2}"}
+        # Create two test users
+        user1 = User(
+            username="user1", email="user1@example.com", password="password123"
+        )
+        user2 = User(
+            username="user2", email="user2@example.com", password="password123"
+        )
 
-            # Create consumption record for user1
-            consumption_data1 = {
-                "date": "2023-10-31T10:00:00Z",
-                "value": 150.75,
-                "type": "electricity",
-                "notes": "User1 consumption",
-            }
-            create_response1 = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data1),
-                content_type="application/json",
-                headers=headers1,
-            )
-            assert create_response1.status_code == 201
+        db.session.add(user1)
+        db.session.add(user2)
+        db.session.commit()
 
-            # Create consumption record for user2
-            consumption_data2 = {
-                "date": "2023-11-01T10:00:00Z",
-                "value": 200.50,
-                "type": "water",
-                "notes": "User2 consumption",
-            }
-            create_response2 = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data2),
-                content_type="application/json",
-                headers=headers2,
-            )
-            assert create_response2.status_code == 201
-
-            # User1 should only see their own record
-            response1 = client.get("/api/consumption", headers=headers1)
-            assert response1.status_code == 200
-            data1 = response1.json
-            assert len(data1["consumptions"]) == 1
-            assert data1["consumptions"][0]["notes"] == "User1 consumption"
-            assert data1["consumptions"][0]["user_id"] == user1.id
-
-            # User2 should only see their own record
-            response2 = client.get("/api/consumption", headers=headers2)
-            assert response2.status_code == 200
-            data2 = response2.json
-            assert len(data2["consumptions"]) == 1
-            assert data2["consumptions"][0]["notes"] == "User2 consumption"
-            assert data2["consumptions"][0]["user_id"] == user2.id
+        headers1 = bearer_headers(user1)
+        headers2 = bearer_headers(user2)
+
+        # Create consumption record for user1
+        consumption_data1 = {
+            "date": "2023-10-31T10:00:00Z",
+            "value": 150.75,
+            "type": "electricity",
+            "notes": "User1 consumption",
+        }
+        create_response1 = client.post(
+            "/api/consumption", json=consumption_data1, headers=headers1
+        )
+        assert create_response1.status_code == 201
+
+        # Create consumption record for user2
+        consumption_data2 = {
+            "date": "2023-11-01T10:00:00Z",
+            "value": 200.50,
+            "type": "water",
+            "notes": "User2 consumption",
+        }
+        create_response2 = client.post(
+            "/api/consumption", json=consumption_data2, headers=headers2
+        )
+        assert create_response2.status_code == 201
+
+        # User1 should only see their own record
+        response1 = client.get("/api/consumption", headers=headers1)
+        assert response1.status_code == 200
+        data1 = response1.json
+        assert len(data1["consumptions"]) == 1
+        assert data1["consumptions"][0]["notes"] == "User1 consumption"
+        assert data1["consumptions"][0]["user_id"] == user1.id
+
+        # User2 should only see their own record
+        response2 = client.get("/api/consumption", headers=headers2)
+        assert response2.status_code == 200
+        data2 = response2.json
+        assert len(data2["consumptions"]) == 1
+        assert data2["consumptions"][0]["notes"] == "User2 consumption"
+        assert data2["consumptions"][0]["user_id"] == user2.id
 
     def test_list_records_order(self, client, auth_headers, test_user):
         """Test that consumption records are ordered by date (newest first)."""
@@ -724,10 +555,7 @@ class TestConsumptionList:
             }
 
             create_response = client.post(
-                "/api/consumption",
-                data=json.dumps(consumption_data),
-                content_type="application/json",
-                headers=auth_headers,
+                "/api/consumption", json=consumption_data, headers=auth_headers
             )
             assert create_response.status_code == 201
 
@@ -757,106 +585,87 @@ class TestConsumptionList:
         response = client.get("/api/consumption", headers=headers)
         assert response.status_code == 401  # JWT decode error
 
-    def test_list_with_inactive_user(self, client, app):
+    def test_list_with_inactive_user(self, client):
         """Test listing consumption records with deactivated user."""
-        with app.app_context():
-            # Create and deactivate user
-            user = User(
-                username="inactive",
-                email="inactive@example.com",
-                password="password123",
-            )
-            user.set_password("password123")
-            user.is_active = False
-            db.session.add(user)
-            db.session.commit()
-
-            # Login (this should work even with inactive user)
-            login_response = client.post(
-                "/api/auth/login",
-                data=json.dumps(
-                    {"email": "inactive@example.com", "password": "password123"}
-                ),
-                content_type="application/json",
-            )
-
-            # Skip this test if login fails for inactive users
-            if login_response.status_code != 200:
-                return
+        # Create and deactivate user
+        user = User(
+            username="inactive",
+            email="inactive@example.com",
+            password="password123",
+        )
+        user.is_active = False
+        db.session.add(user)
+        db.session.commit()
 
-            token = login_response.json["access_token"]
-            headers = {"Authorization": f"Bearer {token}"}
+        # Login refuses inactive users, so mint a token to reach the endpoint
+        headers = bearer_headers(user)
 
-            # Try to list consumptions
-            response = client.get("/api/consumption", headers=headers)
-            assert response.status_code == 401
-            data = response.json
-            assert data["error"] == "inactive_user"
+        # Try to list consumptions
+        response = client.get("/api/consumption", headers=headers)
+        assert response.status_code == 401
+        data = response.json
+        assert data["error"] == "inactive_user"
 
 
 class TestConsumptionAnalytics:
     """Test consumption analytics endpoint functionality."""
 
     @pytest.fixture
-    def sample_consumption_data(self, app, test_user):
+    def sample_consumption_data(self, test_user):
         """Create sample consumption data for analytics testing."""
-        with app.app_context():
-            user = User.query.get(test_user.id)
-
-            # Create consumption records for different months and types
-            consumption_records = [
-                # October 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 10, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=150.75,
-                    type="electricity",
-                    notes="October electricity",
-                ),
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 10, 20, 10, 0, 0, tzinfo=timezone.utc),
-                    value=85.50,
-                    type="water",
-                    notes="October water",
-                ),
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 10, 25, 10, 0, 0, tzinfo=timezone.utc),
-                    value=45.25,
-                    type="gas",
-                    notes="October gas",
-                ),
-                # September 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 9, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=140.00,
-                    type="electricity",
-                    notes="September electricity",
-                ),
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 9, 20, 10, 0, 0, tzinfo=timezone.utc),
-                    value=80.00,
-                    type="water",
-                    notes="September water",
-                ),
-                # August 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 8, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=120.00,
-                    type="electricity",
-                    notes="August electricity",
-                ),
-            ]
-
-            for record in consumption_records:
-                db.session.add(record)
-            db.session.commit()
-
-            return consumption_records
+        # Create consumption records for different months and types
+        rows = [
+            # October 2023
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 10, 15, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 150.75,
+                "type": "electricity",
+                "notes": "October electricity",
+            },
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 10, 20, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 85.50,
+                "type": "water",
+                "notes": "October water",
+            },
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 10, 25, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 45.25,
+                "type": "gas",
+                "notes": "October gas",
+            },
+            # September 2023
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 9, 15, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 140.00,
+                "type": "electricity",
+                "notes": "September electricity",
+            },
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 9, 20, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 80.00,
+                "type": "water",
+                "notes": "September water",
+            },
+            # August 2023
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, 8, 15, 10, 0, 0, tzinfo=timezone.utc),
+                "value": 120.00,
+                "type": "electricity",
+                "notes": "August electricity",
+            },
+        ]
+
+        db.session.bulk_insert_mappings(Consumption, rows)
+        db.session.commit()
+
+        return rows
 
     def test_analytics_success_with_data(
         self, client, auth_headers, sample_consumption_data
@@ -895,10 +704,9 @@ class TestConsumptionAnalytics:
         assert isinstance(monthly_data, list)
 
         # Should have data for months with records
-        october_data = next(
-            (item for item in monthly_data if item["month"] == "2023-10"), None
-        )
-        assert october_data is not None
+        monthly_by_month = {item["month"]: item for item in monthly_data}
+        assert "2023-10" in monthly_by_month
+        october_data = monthly_by_month["2023-10"]
         assert october_data["total"] == 281.5  # 150.75 + 85.50 + 45.25
         assert october_data["electricity"] == 150.75
         assert october_data["water"] == 85.50
@@ -937,135 +745,86 @@ class TestConsumptionAnalytics:
         response = client.get("/api/consumption/analytics", headers=headers)
         assert response.status_code == 401
 
-    def test_analytics_user_isolation(self, client, app):
+    def test_analytics_user_isolation(self, client):
         """Test that analytics only shows data for the authenticated user."""
-        with app.app_context():
-            # Create two users
-            user1 = User(
-                username="user1", email="user1@example.com", password="password123"
-            )
-            user1.set_password("password123")
-            user2 = User(
-                username="user2", email="user2@example.com", password="password123"
-            )
-            user2.set_password("password123")
-
-            db.session.add(user1)
-            db.session.add(user2)
-            db.session.commit()
-
-            # Add consumption data for both users
-            consumption1 = Consumption(
-                user_id=user1.id,
-                date=datetime.now(timezone.utc),
-                value=100.0,
-                type="electricity",
-            )
-            consumption2 = Consumption(
-                user_id=user2.id,
-                date=datetime.now(timezone.utc),
-                value=200.0,
-                type="electricity",
-            )
+        # Create two users
+        user1 = User(
+            username="user1", email="user1@example.com", password="password123"
+        )
+        user2 = User(
+            username="user2", email="user2@example.com", password="password123"
+        )
 
-            db.session.add(consumption1)
-            db.session.add(consumption2)
-            db.session.commit()
-
-            # Login as user1
-            login_response = client.post(
-                "/api/auth/login",
-                data=json.dumps(
-                    {"email": "user1@example.com", "password": "password123"}
-                ),
-                content_type="application/json",
-            )
-            assert login_response.status_code == 200
+        db.session.add(user1)
+        db.session.add(user2)
+        db.session.commit()
+
+        # Add consumption data for both users
+        consumption1 = Consumption(
+            user_id=user1.id,
+            date=datetime.now(timezone.utc),
+            value=100.0,
+            type="electricity",
+        )
+        consumption2 = Consumption(
+            user_id=user2.id,
+            date=datetime.now(timezone.utc),
+            value=200.0,
+            type="electricity",
+        )
 
-            token = login_response.json["access_token"]
-            headers = {"Authorization": f"Bearer {token}"}
+        db.session.add(consumption1)
+        db.session.add(consumption2)
+        db.session.commit()
 
-            # Get analytics for user1
-            response = client.get("/api/consumption/analytics", headers=headers)
-            assert response.status_code == 200
+        headers = bearer_headers(user1)
 
-            analytics = response.json["analytics"]
-            # Should only see user1's data (100.0), not user2's data (200.0)
-            assert analytics["total_consumption"] == 100.0
-            assert analytics["total_records"] == 1
+        # Get analytics for user1
+        response = client.get("/api/consumption/analytics", headers=headers)
+        assert response.status_code == 200
 
-    def test_analytics_with_inactive_user(self, client, app):
-        """Test analytics access with deactivated user."""
-        with app.app_context():
-            # Create and deactivate user
-            user = User(
-                username="inactive",
-                email="inactive@example.com",
-                password="password123",
-            )
-            user.set_password("password123")
-            user.is_active = False
-            db.session.add(user)
-            db.session.commit()
-
-            # Login (this should work even with inactive user for some systems)
-            login_response = client.post(
-                "/api/auth/login",
-                data=json.dumps(
-                    {"email": "inactive@example.com", "password": "password123"}
-                ),
-                content_type="application/json",
-            )
+        analytics = response.json["analytics"]
+        # Should only see user1's data (100.0), not user2's data (200.0)
+        assert analytics["total_consumption"] == 100.0
+        assert analytics["total_records"] == 1
 
-            # Skip this test if login fails for inactive users
-            if login_response.status_code != 200:
-                return
+    def test_analytics_with_inactive_user(self, client):
+        """Test analytics access with deactivated user."""
+        # Create and deactivate user
+        user = User(
+            username="inactive",
+            email="inactive@example.com",
+            password="password123",
+        )
+        user.is_active = False
+        db.session.add(user)
+        db.session.commit()
 
-            token = login_response.json["access_token"]
-            headers = {"Authorization": f"Bearer {token}"}
+        # Login refuses inactive users, so mint a token to reach the endpoint
+        headers = bearer_headers(user)
 
-            # Try to get analytics
-            response = client.get("/api/consumption/analytics", headers=headers)
-            assert response.status_code == 401
-            data = response.json
-            assert data["error"] == "inactive_user"
+        # Try to get analytics
+        response = client.get("/api/consumption/analytics", headers=headers)
+        assert response.status_code == 401
+        data = response.json
+        assert data["error"] == "inactive_user"
 
-    def test_analytics_monthly_data_ordering(
-        self, client, auth_headers, app, test_user
-    ):
+    def test_analytics_monthly_data_ordering(self, client, auth_headers, test_user):
         """Test that monthly data is properly ordered by month."""
-        with app.app_context():
-            user = User.query.get(test_user.id)
-
-            # Create consumption records in different months
-            # (not in chronological order)
-            consumption_records = [
-                # March 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 3, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=100.0,
-                    type="electricity",
-                ),
-                # January 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 1, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=200.0,
-                    type="electricity",
-                ),
-                # February 2023
-                Consumption(
-                    user_id=user.id,
-                    date=datetime(2023, 2, 15, 10, 0, 0, tzinfo=timezone.utc),
-                    value=150.0,
-                    type="electricity",
-                ),
-            ]
-
-            for record in consumption_records:
-                db.session.add(record)
-            db.session.commit()
+        # Create consumption records in different months
+        # (not in chronological order)
+        rows = [
+            {
+                "user_id": test_user.id,
+                "date": datetime(2023, month, 15, 10, 0, 0, tzinfo=timezone.utc),
+                "value": value,
+                "type": "electricity",
+            }
+            for month, value in ((3, 100.0), (1, 200.0), (2, 150.0))
+        ]
+
+        db.session.bulk_insert_mappings(Consumption, rows)
+        db.session.commit()
 
         response = client.get("/api/consumption/analytics", headers=auth_headers)
 
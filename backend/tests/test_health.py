@@ -7,96 +7,85 @@ import pytest
 from flask import Flask
 
 from app import create_app
+from app.config import TestingConfig
+from app.routes.health import health_bp, health_check
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the Flask application."""
-    from app.config import Config
-
-    class TestConfig(Config):
-        TESTING = True
-        SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
-        SECRET_KEY = "test-secret-key"
-        WTF_CSRF_ENABLED = False
+def test_app_creation(app):
+    """Test that the Flask app can be created successfully."""
+    assert isinstance(app, Flask)
+    assert app.config["TESTING"] is True
 
-    app = create_app(TestConfig)
 
-    with app.test_client() as client:
-        with app.app_context():
-            yield client
+def test_app_config_overrides():
+    """Test that keyword overrides are applied on top of the config class."""
+    app = create_app(TestingConfig, SECRET_KEY="override-secret-key")
+    assert app.config["SECRET_KEY"] == "override-secret-key"
+    assert app.config["TESTING"] is True
 
 
-def test_app_creation():
-    """Test that the Flask app can be created successfully."""
-    from app.config import Config
+def test_health_check_view(app):
+    """Test the health check view without going through the WSGI stack."""
+    with app.test_request_context("/health"):
+        data = health_check()
 
-    class TestConfig(Config):
-        TESTING = True
-        SECRET_KEY = "test-secret-key"
-
-    app = create_app(TestConfig)
-    assert isinstance(app, Flask)
-    assert app.config["TESTING"] is True
+    assert data["status"] == "healthy"
+    assert data["service"] == "consumer-testapp-backend"
+    assert data["version"] == "1.0.0"
 
 
 def test_health_endpoint(client):
-    """Test the health check endpoint."""
-    response = client.get("/health")
+    """Test the health check endpoint end to end."""
+    response = client.get("/api/health")
     assert response.status_code == 200
 
     data = response.get_json()
     assert data is not None
     assert data["status"] == "healthy"
-    assert data["service"] == "consumer-testapp-backend"
-    assert data["version"] == "1.0.0"
 
 
-def test_app_startup():
-    """Test that the app can start without errors."""
-    from app.config import Config
+def test_health_blueprint_standalone():
+    """Test that the health blueprint works without the rest of the app."""
+    lean_app = Flask(__name__)
+    lean_app.register_blueprint(health_bp)
+
+    response = lean_app.test_client().get("/health")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "healthy"
 
-    class TestConfig(Config):
-        TESTING = True
-        SECRET_KEY = "test-secret-key"
 
-    app = create_app(TestConfig)
+def test_app_startup(app):
+    """Test that the app can start without errors."""
     assert app is not None
     assert hasattr(app, "config")
 
 
-def test_basic_route_access(client):
-    """Test that basic routes are accessible."""
-    # Test root route
-    response = client.get("/")
-    # Various acceptable responses
-    assert response.status_code in [200, 404, 405]
-
-
 class TestBasicAPI:
     """Test basic API functionality."""
 
-    def test_app_has_required_config(self):
+    def test_app_has_required_config(self, app):
         """Test that the app has required configuration."""
-        from app.config import Config
-
-        class TestConfig(Config):
-            TESTING = True
-            SECRET_KEY = "test-secret-key"
-
-        app = create_app(TestConfig)
         assert "TESTING" in app.config
         assert "SECRET_KEY" in app.config
 
-    def test_cors_headers(self, client):
-        """Test that CORS headers are properly configured (if enabled)."""
-        response = client.options("/")
-        # This test will pass regardless of CORS configuration
-        assert response.status_code in [200, 404, 405]
-
-    def test_json_response(self, client):
-        """Test JSON response handling."""
-        headers = {"Accept": "application/json"}
-        response = client.get("/api/test", headers=headers)
-        # Accept various status codes as we're just testing the app responds
-        assert response.status_code in [200, 404, 405, 500]
+    @pytest.mark.parametrize(
+        "method,path,headers,expected_statuses",
+        [
+            # Basic route access
+            pytest.param("get", "/", None, {200, 404, 405}, id="root"),
+            # Passes regardless of CORS configuration
+            pytest.param("options", "/", None, {200, 404, 405}, id="cors-preflight"),
+            # Just testing that the app responds to a JSON request
+            pytest.param(
+                "get",
+                "/api/test",
+                {"Accept": "application/json"},
+                {200, 404, 405, 500},
+                id="json-accept",
+            ),
+        ],
+    )
+    def test_route_responds(self, client, method, path, headers, expected_statuses):
+        """Test that the app answers basic requests with an acceptable status."""
+        response = getattr(client, method)(path, headers=headers)
+        assert response.status_code in expected_statuses
@@ -0,0 +1,142 @@
+"""
+Tests for the JWT authentication helpers.
+
+The shared session app cannot take new routes once it has served requests,
+so these tests build their own app with a ``@token_required`` route on a
+private in-memory database.
+"""
+
+from datetime import timedelta
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy.pool import StaticPool
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.models.user import User
+from app.utils.jwt_utils import get_current_user, token_required
+
+
+@pytest.fixture(scope="module")
+def jwt_app():
+    """Create an app with a token_required route on its own database."""
+    app = create_app(
+        TestingConfig,
+        SQLALCHEMY_DATABASE_URI="sqlite://",
+        SQLALCHEMY_ENGINE_OPTIONS={
+            "poolclass": StaticPool,
+            "connect_args": {"check_same_thread": False},
+        },
+        SECRET_KEY="test-secret-key",
+        JWT_SECRET_KEY="test-jwt-secret-key",
+    )
+
+    @app.route("/protected")
+    @token_required
+    def protected(current_user):
+        return {"user_id": current_user.id}
+
+    with app.app_context():
+        db.create_all()
+
+    yield app
+
+    with app.app_context():
+        db.drop_all()
+
+
+@pytest.fixture(scope="module")
+def user_ids(jwt_app):
+    """Seed an active and a deactivated user and return their IDs."""
+    with jwt_app.app_context():
+        active = User(username="active", email="active@example.com", password="x")
+        inactive = User(username="inactive", email="inactive@example.com", password="x")
+        inactive.is_active = False
+        db.session.add_all([active, inactive])
+        db.session.commit()
+        return {"active": active.id, "inactive": inactive.id}
+
+
+@pytest.fixture(scope="module")
+def jwt_client(jwt_app):
+    """Create a test client for the token_required app."""
+    return jwt_app.test_client(use_cookies=False)
+
+
+def bearer(app, identity):
+    """Mint an access token for identity and return the request headers."""
+    with app.app_context():
+        token = create_access_token(identity=identity)
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestTokenRequired:
+    """Test the token_required decorator."""
+
+    def test_missing_token(self, jwt_client):
+        """Test that a request without a token is rejected."""
+        response = jwt_client.get("/protected")
+        assert response.status_code == 401
+        assert response.get_json()["error"] == "missing_token"
+
+    def test_invalid_token(self, jwt_client):
+        """Test that a malformed token is rejected."""
+        response = jwt_client.get(
+            "/protected", headers={"Authorization": "Bearer not-a-jwt"}
+        )
+        assert response.status_code == 401
+        assert response.get_json()["error"] == "invalid_token"
+
+    def test_inactive_user(self, jwt_app, jwt_client, user_ids):
+        """Test that a valid token for a deactivated user is rejected."""
+        user_id = user_ids["inactive"]
+        response = jwt_client.get("/protected", headers=bearer(jwt_app, str(user_id)))
+        assert response.status_code == 401
+        assert response.get_json()["error"] == "inactive_user"
+
+    def test_valid_token_passes_current_user(self, jwt_app, jwt_client, user_ids):
+        """Test that the view receives the authenticated user."""
+        user_id = user_ids["active"]
+        response = jwt_client.get("/protected", headers=bearer(jwt_app, str(user_id)))
+        assert response.status_code == 200
+        assert response.get_json() == {"user_id": user_id}
+
+
+class TestGetCurrentUser:
+    """Test get_current_user outside of a protected route."""
+
+    def current_user_for(self, app, headers=None):
+        """Call get_current_user in a request context carrying headers."""
+        with app.test_request_context("/", headers=headers):
+            return get_current_user()
+
+    def test_missing_header(self, jwt_app):
+        """Test that a request without a token yields no user."""
+        assert self.current_user_for(jwt_app) is None
+
+    def test_malformed_token(self, jwt_app):
+        """Test that a malformed token yields no user."""
+        headers = {"Authorization": "Bearer not-a-jwt"}
+        assert self.current_user_for(jwt_app, headers) is None
+
+    def test_expired_token(self, jwt_app, user_ids):
+        """Test that an expired token yields no user."""
+        with jwt_app.app_context():
+            token = create_access_token(
+                identity=str(user_ids["active"]), expires_delta=timedelta(seconds=-1)
+            )
+        headers = {"Authorization": f"Bearer {token}"}
+        assert self.current_user_for(jwt_app, headers) is None
+
+    def test_non_numeric_identity(self, jwt_app):
+        """Test that a valid token with a non-numeric identity yields no user."""
+        assert self.current_user_for(jwt_app, bearer(jwt_app, "not-an-id")) is None
+
+    def test_valid_token(self, jwt_app, user_ids):
+        """Test that a valid token yields the matching user."""
+        headers = bearer(jwt_app, str(user_ids["active"]))
+        with jwt_app.test_request_context("/", headers=headers):
+            user = get_current_user()
+            assert user is not None
+            assert user.id == user_ids["active"]